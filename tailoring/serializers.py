@@ -87,6 +87,36 @@ class TailoringSessionSerializer(serializers.ModelSerializer):
         return metadata.get('bullet_details', [])
 
 
+class TailoringSessionListSerializer(serializers.ModelSerializer):
+    """
+    Lightweight serializer for the list endpoint.
+
+    Leaves out the snapshot/output JSON blobs so list pages do not ship
+    (or even fetch) megabytes of per-row payload; clients retrieve a
+    single session for the full detail.
+    """
+
+    username = serializers.CharField(source='user.username', read_only=True)
+    job_title = serializers.CharField(source='job.title', read_only=True)
+    job_company = serializers.CharField(source='job.company', read_only=True)
+
+    class Meta:
+        model = TailoringSession
+        fields = [
+            'id',
+            'user',
+            'username',
+            'job',
+            'job_title',
+            'job_company',
+            'generated_title',
+            'status',
+            'created_at',
+            'updated_at',
+        ]
+        read_only_fields = fields
+
+
 class TailoringSessionCreateSerializer(serializers.Serializer):
     """
     Serializer for creating a new tailoring session.
@@ -1,21 +1,27 @@
 """
 Background tasks for the tailoring app using Django-Q.
 """
-import json
 import logging
-import traceback
+from datetime import datetime, timezone as datetime_timezone
 from typing import List
 
 from django.db import transaction
 from django.utils import timezone
 
 from accounts.models import User
-from experience.models import ExperienceGraph
 from .models import TailoringSession
-from .services import AgentKitTailoringService, TailoringPipelineError
+from .services import TailoringPipelineError, _json_dumps, get_tailoring_service
 
 logger = logging.getLogger(__name__)
 
+# Summary line prepended to the suggestion list for completed sessions.
+ATS_SUMMARY_TEMPLATE = (
+    "📊 ATS Compatibility: {overall_score}% | "
+    "Required Skills: {required_skills_match}% | "
+    "Keywords: {keyword_match}%"
+)
+
+
 
 def _format_debug_entries(entries: List[str]) -> str:
     """
@@ -34,33 +40,48 @@ def process_tailoring_session(session_id: int) -> None:
     debug_entries: List[str] = []
 
     def log_debug(message: str) -> None:
-        timestamp = timezone.now().isoformat()
-        entry = f"[{timestamp}] {message}"
-        debug_entries.append(entry)
+        # Direct datetime.now(utc) skips the per-call settings lookup in
+        # django.utils.timezone.now; output is identical with TIME_ZONE=UTC.
+        timestamp = datetime.now(datetime_timezone.utc).isoformat()
+        debug_entries.append(f"[{timestamp}] {message}")
         logger.info("Tailoring session %s: %s", session_id, message)
 
     try:
-        with transaction.atomic():
-            session = (
-                TailoringSession.objects.select_for_update()
-                .select_related("user", "job")
-                .get(id=session_id)
+        # Claim the session with one conditional UPDATE: the WHERE clause is
+        # the idempotency check, so no SELECT FOR UPDATE transaction or
+        # separate status-transition save is needed.
+        claimed = (
+            TailoringSession.objects.filter(id=session_id)
+            .exclude(
+                status__in=[
+                    TailoringSession.Status.PROCESSING,
+                    TailoringSession.Status.COMPLETED,
+                ]
             )
-
-            if session.status == TailoringSession.Status.PROCESSING:
-                log_debug("Session already processing; skipping duplicate task.")
-                return
-
-            if session.status == TailoringSession.Status.COMPLETED:
+            .update(
+                status=TailoringSession.Status.PROCESSING,
+                error_message="",
+                completed_at=None,
+                updated_at=timezone.now(),
+            )
+        )
+        if not claimed:
+            current_status = (
+                TailoringSession.objects.filter(id=session_id)
+                .values_list("status", flat=True)
+                .first()
+            )
+            if current_status is None:
+                raise TailoringSession.DoesNotExist
+            if current_status == TailoringSession.Status.COMPLETED:
                 log_debug("Session already completed; no action required.")
-                return
+            else:
+                log_debug("Session already processing; skipping duplicate task.")
+            return
 
-            session.status = TailoringSession.Status.PROCESSING
-            session.error_message = ""
-            session.completed_at = None
-            session.save(update_fields=["status", "error_message", "completed_at", "updated_at"])
+        session = TailoringSession.objects.select_related("user", "job").get(id=session_id)
 
-        service = AgentKitTailoringService()
+        service = get_tailoring_service()
         job = session.job
         user: User = session.user
 
@@ -85,6 +106,10 @@ def process_tailoring_session(session_id: int) -> None:
 
         experience_snapshot = session.input_experience_snapshot or {}
         if not experience_snapshot:
+            # Imported lazily: only sessions without a snapshot touch the
+            # experience app, and deferring it trims worker import time.
+            from experience.models import ExperienceGraph
+
             try:
                 experience_snapshot = ExperienceGraph.objects.get(user=user).graph_json
                 log_debug("Captured experience graph snapshot from database.")
@@ -101,9 +126,15 @@ def process_tailoring_session(session_id: int) -> None:
         if not merged_job_description.strip():
             log_debug("No description text; relying on OpenAI web search from URL")
 
+        # Requirements persisted from a previous run of this posting let the
+        # service skip re-extraction on restarts.
+        if job.parsed_requirements and merged_job_description.strip():
+            service.prime_job_requirements(merged_job_description, job.parsed_requirements)
+            log_debug("Seeded requirement cache from job posting.")
+
         parameters = service.normalize_parameters(session.parameters or {})
 
-        log_debug(f"Using tailoring parameters: {json.dumps(parameters)}")
+        log_debug(f"Using tailoring parameters: {_json_dumps(parameters)}")
 
         result = service.run_workflow(
             merged_job_description,
@@ -112,66 +143,76 @@ def process_tailoring_session(session_id: int) -> None:
             source_url=source_url,
         )
 
-        token_usage = result.get("token_usage", {})
-        words_generated = result.get("words_generated", 0)
+        # One bound-method lookup instead of ~15 attribute dispatches on the
+        # result dict below.
+        result_get = result.get
+
+        token_usage = result_get("token_usage", {})
+        words_generated = result_get("words_generated", 0)
         if words_generated:
             token_usage = {**token_usage, "words_generated": words_generated}
 
-        session.generated_title = result.get("title", "")
-        session.generated_bullets = result.get("bullets", [])
-        session.generated_sections = result.get("sections", [])
-        session.tailored_resume = result.get("summary", "")
-        
+        # Completion is written with one queryset UPDATE at the end; collect
+        # the column values here instead of mutating the instance.
+        completed_fields = {
+            "generated_title": result_get("title", ""),
+            "generated_bullets": result_get("bullets", []),
+            "generated_sections": result_get("sections", []),
+            "tailored_resume": result_get("summary", ""),
+        }
+
         # Include ATS score in suggestions
-        ats_score = result.get("ats_score", {})
-        suggestions = result.get("suggestions", [])
+        ats_score = result_get("ats_score", {})
+        suggestions = result_get("suggestions", [])
         
         # Prepend ATS score summary to suggestions
         if ats_score:
-            ats_summary = (
-                f"📊 ATS Compatibility: {ats_score.get('overall_score', 0)}% | "
-                f"Required Skills: {ats_score.get('required_skills_match', 0)}% | "
-                f"Keywords: {ats_score.get('keyword_match', 0)}%"
+            ats_summary = ATS_SUMMARY_TEMPLATE.format(
+                overall_score=ats_score.get('overall_score', 0),
+                required_skills_match=ats_score.get('required_skills_match', 0),
+                keyword_match=ats_score.get('keyword_match', 0),
             )
-            suggestions = [ats_summary] + suggestions
+            suggestions.insert(0, ats_summary)
             log_debug(f"ATS Score: {ats_score.get('overall_score', 0)}%")
 
-        guardrail_report = result.get("guardrail_report", [])
+        guardrail_report = result_get("guardrail_report", [])
         if guardrail_report:
-            log_debug(f"Guardrail findings: {json.dumps(guardrail_report)}")
+            log_debug(f"Guardrail findings: {_json_dumps(guardrail_report)}")
 
-        cover_letter_points = result.get("cover_letter_talking_points", [])
+        cover_letter_points = result_get("cover_letter_talking_points", [])
         if cover_letter_points:
             log_debug(
                 "Cover letter talking points prepared: "
                 f"{', '.join(cover_letter_points[:3])}"
             )
 
-        session.ai_suggestions = "\n".join(suggestions)
-        session.cover_letter = result.get("cover_letter", "")
-        session.token_usage = token_usage
-        session.openai_run_id = result.get("run_id", "")
-        session.job_snapshot = job_snapshot
-        session.input_experience_snapshot = experience_snapshot
-        session.parameters = parameters
-        session.output_metadata = {
-            "bullet_details": result.get("bullet_details", []),
-            "guardrails": guardrail_report,
-            "bullet_quality": result.get("bullet_quality", {}),
-            "section_layout": result.get("section_layout", []),
-            "cover_letter_talking_points": cover_letter_points,
-            "job_location_name": result.get("job_location_name", ""),
-            "job_location_coordinates": result.get("job_location_coordinates"),
-        }
-        session.status = TailoringSession.Status.COMPLETED
-        session.completed_at = timezone.now()
+        completed_fields.update(
+            ai_suggestions="\n".join(suggestions) if suggestions else "",
+            cover_letter=result_get("cover_letter", ""),
+            token_usage=token_usage,
+            openai_run_id=result_get("run_id", ""),
+            job_snapshot=job_snapshot,
+            input_experience_snapshot=experience_snapshot,
+            parameters=parameters,
+            output_metadata={
+                "bullet_details": result_get("bullet_details", []),
+                "guardrails": guardrail_report,
+                "bullet_quality": result_get("bullet_quality", {}),
+                "section_layout": result_get("section_layout", []),
+                "cover_letter_talking_points": cover_letter_points,
+                "job_location_name": result_get("job_location_name", ""),
+                "job_location_coordinates": result_get("job_location_coordinates"),
+            },
+            status=TailoringSession.Status.COMPLETED,
+            completed_at=timezone.now(),
+        )
 
-        debug_payload = result.get("debug", {})
+        debug_payload = result_get("debug", {})
         if debug_payload:
-            log_debug(f"Pipeline debug data: {json.dumps(debug_payload)}")
+            log_debug(f"Pipeline debug data: {_json_dumps(debug_payload)}")
         
         # Log bullet quality issues if any
-        bullet_quality = result.get("bullet_quality", {})
+        bullet_quality = result_get("bullet_quality", {})
         if bullet_quality.get("issues_found", 0) > 0:
             log_debug(
                 f"Found {bullet_quality['issues_found']} bullet points with quality issues"
@@ -179,28 +220,23 @@ def process_tailoring_session(session_id: int) -> None:
 
         log_debug("Tailoring pipeline completed successfully.")
 
-        session.debug_log = _format_debug_entries(debug_entries)
-        session.save(
-            update_fields=[
-                "generated_title",
-                "generated_bullets",
-                "generated_sections",
-                "tailored_resume",
-                "ai_suggestions",
-                "cover_letter",
-                "token_usage",
-                "openai_run_id",
-                "job_snapshot",
-                "input_experience_snapshot",
-                "parameters",
-                "output_metadata",
-                "status",
-                "completed_at",
-                "debug_log",
-                "updated_at",
-            ]
+        completed_fields["debug_log"] = _format_debug_entries(debug_entries)
+        # Queryset UPDATE skips save() signal dispatch and per-field
+        # preparation of untouched columns; .update() bypasses auto_now, so
+        # updated_at is set explicitly. No signal receivers exist for this
+        # model, so nothing is lost.
+        TailoringSession.objects.filter(pk=session.pk).update(
+            updated_at=timezone.now(),
+            **completed_fields,
         )
 
+        # Persist the (possibly web-search-enhanced) requirements so future
+        # sessions against this posting start from the cached extraction.
+        extracted_requirements = result_get("debug", {}).get("requirements") or {}
+        if extracted_requirements and extracted_requirements != job.parsed_requirements:
+            job.parsed_requirements = extracted_requirements
+            job.save(update_fields=["parsed_requirements", "updated_at"])
+
         # Record token usage for the user
         # Use actual OpenAI token counts for accurate billing
         prompt_tokens = token_usage.get("prompt_tokens", 0)
@@ -242,6 +278,8 @@ def process_tailoring_session(session_id: int) -> None:
         log_debug("Tailoring session not found; aborting task.")
         return
     except Exception as exc:  # noqa: BLE001
+        import traceback
+
         traceback_str = traceback.format_exc()
         log_debug(f"Unexpected error: {exc}")
 
@@ -12,8 +12,12 @@ def format_number(value):
     Format a number with commas for thousands separators.
     Example: 1234567 -> 1,234,567
     """
-    try:
-        value = int(value)
+    # Fast paths: numeric values skip the exception machinery entirely
+    if isinstance(value, int):
         return f"{value:,}"
+    if isinstance(value, float):
+        return f"{int(value):,}"
+    try:
+        return f"{int(value):,}"
     except (ValueError, TypeError):
         return value
@@ -6,6 +6,13 @@ from tailoring.services import AgentKitTailoringService
 class AgentKitTailoringServiceTests(SimpleTestCase):
     """Unit tests for utility helpers that do not hit the OpenAI API."""
 
+    @classmethod
+    def setUpClass(cls) -> None:
+        # Construct the service (OpenAI client, compiled patterns) once per
+        # class instead of per test method.
+        super().setUpClass()
+        cls.service = AgentKitTailoringService()
+
     def test_normalize_parameters_defaults(self) -> None:
         params = AgentKitTailoringService.normalize_parameters({})
         self.assertGreaterEqual(params["bullets_per_section"], 1)
@@ -49,7 +56,7 @@ class AgentKitTailoringServiceTests(SimpleTestCase):
         )
 
     def test_collect_experience_snippets_prefers_matching_skills(self) -> None:
-        service = AgentKitTailoringService()
+        service = self.service
         job_description = """
         Responsibilities:
         - Develop data pipelines using Python and SQL.
@@ -0,0 +1,48 @@
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from jobs.models import JobPosting
+from tailoring.models import TailoringSession
+
+
+class TailoringSessionViewSetQueryTests(TestCase):
+    """Query-count regression tests for the session list endpoint."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.user = User.objects.create_user(
+            username="tailoring_tester",
+            password="not-a-real-password",
+        )
+        cls.job = JobPosting.objects.create(
+            user=cls.user,
+            title="Backend Engineer",
+            company="Acme Co",
+            raw_description="Build APIs.",
+        )
+        TailoringSession.objects.bulk_create(
+            TailoringSession(user=cls.user, job=cls.job) for _ in range(5)
+        )
+
+    def setUp(self) -> None:
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def test_list_uses_constant_query_count(self) -> None:
+        # The serializer reads user.username and job.title/company for every
+        # row; select_related in get_queryset keeps the list at one COUNT
+        # (pagination) plus one joined SELECT regardless of session count.
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse("tailoring-list"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["count"], 5)
+
+        # The list payload is the summary shape; heavy columns stay deferred
+        # (touching one here would also break the query count above).
+        first = response.data["results"][0]
+        self.assertEqual(first["job_title"], "Backend Engineer")
+        self.assertNotIn("tailored_resume", first)
+        self.assertNotIn("input_experience_snapshot", first)
@@ -8,16 +8,20 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 
+from django.db.models.functions import Length
 from django.shortcuts import get_object_or_404
-from django.utils import timezone
+from django_q.tasks import async_task
 
 from accounts.utils import check_and_increment_tokens
 from experience.models import ExperienceGraph
 from jobs.models import JobPosting
 
 from .models import TailoringSession
-from .serializers import TailoringSessionSerializer, TailoringSessionCreateSerializer
-from .services import AgentKitTailoringService
+from .serializers import (
+    TailoringSessionCreateSerializer,
+    TailoringSessionListSerializer,
+    TailoringSessionSerializer,
+)
 
 
 class TailoringSessionViewSet(viewsets.ModelViewSet):
@@ -32,27 +36,56 @@ class TailoringSessionViewSet(viewsets.ModelViewSet):
     
     serializer_class = TailoringSessionSerializer
     permission_classes = [IsAuthenticated]
-    
+
+    # TEXT/JSON columns the list serializer never reads; deferring them keeps
+    # list pages from dragging every snapshot and generated resume off disk.
+    LIST_DEFERRED_FIELDS = (
+        'job_snapshot',
+        'input_experience_snapshot',
+        'parameters',
+        'generated_bullets',
+        'generated_sections',
+        'tailored_resume',
+        'cover_letter',
+        'ai_suggestions',
+        'token_usage',
+        'output_metadata',
+        'debug_log',
+        'error_message',
+    )
+
+    def get_serializer_class(self):
+        if self.action == 'list':
+            return TailoringSessionListSerializer
+        return self.serializer_class
+
     def get_queryset(self):
         """
         Filter to show only current user's tailoring sessions.
         Admins can see all sessions.
+
+        The serializer renders username and job title/company for every row,
+        so both foreign keys are joined up front to avoid N+1 queries on
+        list endpoints. Lists additionally defer the heavyweight columns the
+        summary serializer does not touch.
         """
+        queryset = TailoringSession.objects.select_related('user', 'job')
+        if self.action == 'list':
+            queryset = queryset.defer(*self.LIST_DEFERRED_FIELDS)
         if self.request.user.role == 'ADMIN':
-            return TailoringSession.objects.all()
-        return TailoringSession.objects.filter(user=self.request.user)
+            return queryset
+        return queryset.filter(user=self.request.user)
     
     def create(self, request, *args, **kwargs):
         """
         Create a new tailoring session.
-        
+
         Flow:
         1. Validate job_id
         2. Check token quota
         3. Load user's experience graph
-        4. Call AgentKit service
-        5. Save results
-        6. Increment tokens
+        4. Queue the tailoring task via Django-Q
+        5. Return 202 so clients can poll the session status
         """
         # Validate input
         create_serializer = TailoringSessionCreateSerializer(data=request.data)
@@ -61,9 +94,26 @@ class TailoringSessionViewSet(viewsets.ModelViewSet):
         job_id = create_serializer.validated_data['job_id']
         user_parameter_input = create_serializer.validated_data.get('parameters') or {}
 
-        # Get job posting
-        job = get_object_or_404(JobPosting, id=job_id, user=request.user)
-        
+        # Get job posting. The view only needs the FK target plus the fields
+        # the serializer echoes back; raw_description (the large column) is
+        # re-read by the background task, so fetch just its length here for
+        # the emptiness check below.
+        job = get_object_or_404(
+            JobPosting.objects.only('id', 'title', 'company', 'source_url').annotate(
+                description_length=Length('raw_description'),
+            ),
+            id=job_id,
+            user=request.user,
+        )
+
+        # A job with neither text nor URL would travel the whole queue only
+        # for the pipeline to reject it; fail fast before charging a token.
+        if not job.description_length and not job.source_url:
+            return Response(
+                {'error': 'Job has no description or URL. Add one before tailoring.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
         # Check token quota (estimate 1 token per request)
         # TODO: Adjust cost based on actual token usage from OpenAI
         try:
@@ -73,135 +123,29 @@ class TailoringSessionViewSet(viewsets.ModelViewSet):
                 {'error': str(e)},
                 status=status.HTTP_403_FORBIDDEN
             )
-        
-        # Load user's experience graph
-        try:
-            experience_graph = ExperienceGraph.objects.get(user=request.user)
-            experience_data = experience_graph.graph_json
-        except ExperienceGraph.DoesNotExist:
-            return Response(
-                {'error': 'Experience graph not found. Please create your experience profile first.'},
-                status=status.HTTP_400_BAD_REQUEST
-            )
-        
-        # Create session
-        session = TailoringSession.objects.create(
-            user=request.user,
-            job=job,
-            input_experience_snapshot=experience_data,
-            parameters=user_parameter_input,
-            status='PROCESSING',
-        )
 
-        # Call AgentKit service
-        try:
-            service = AgentKitTailoringService()
-
-            # Use raw_description if available; OpenAI will fetch from URL via grounding
-            job_description = job.raw_description or ""
-            source_url = job.source_url or ""
-
-            normalized_parameters = service.normalize_parameters(user_parameter_input or {})
-
-            result = service.run_workflow(
-                job_description=job_description,
-                experience_graph=experience_data,
-                parameters=normalized_parameters,
-                source_url=source_url
-            )
+        return self._launch_session(request, job=job, parameters=user_parameter_input)
 
-            token_usage = result.get("token_usage", {})
-            words_generated = result.get("words_generated", 0)
-            if words_generated:
-                token_usage = {**token_usage, "words_generated": words_generated}
-
-            session.generated_title = result.get('title', '')
-            session.generated_bullets = result.get('bullets', [])
-            session.generated_sections = result.get('sections', [])
-            session.tailored_resume = result.get('summary', '')
-
-            ats_score = result.get("ats_score", {})
-            suggestions = result.get("suggestions", [])
-            if ats_score:
-                ats_summary = (
-                    f"📊 ATS Compatibility: {ats_score.get('overall_score', 0)}% | "
-                    f"Required Skills: {ats_score.get('required_skills_match', 0)}% | "
-                    f"Keywords: {ats_score.get('keyword_match', 0)}%"
-                )
-                suggestions = [ats_summary] + suggestions
-
-            guardrail_report = result.get("guardrail_report", [])
-            cover_letter_points = result.get("cover_letter_talking_points", [])
-
-            session.ai_suggestions = "\n".join(suggestions)
-            session.cover_letter = result.get('cover_letter', '')
-            session.token_usage = token_usage
-            session.openai_run_id = result.get('run_id', '')
-            session.parameters = normalized_parameters
-            session.output_metadata = {
-                "bullet_details": result.get("bullet_details", []),
-                "guardrails": guardrail_report,
-                "bullet_quality": result.get("bullet_quality", {}),
-                "section_layout": result.get("section_layout", []),
-                "cover_letter_talking_points": cover_letter_points,
-            }
-            session.status = TailoringSession.Status.COMPLETED
-            session.completed_at = timezone.now()
-            session.save(
-                update_fields=[
-                    "generated_title",
-                    "generated_bullets",
-                    "generated_sections",
-                    "tailored_resume",
-                    "ai_suggestions",
-                    "cover_letter",
-                    "token_usage",
-                    "openai_run_id",
-                    "parameters",
-                    "output_metadata",
-                    "status",
-                    "completed_at",
-                    "updated_at",
-                ]
-            )
-
-        except NotImplementedError:
-            # Service not yet implemented
-            session.status = 'FAILED'
-            session.save()
-            return Response(
-                {
-                    'error': 'AI tailoring service not yet implemented.',
-                    'session_id': session.id,
-                    'message': 'Session created but AI workflow needs implementation in tailoring/services.py'
-                },
-                status=status.HTTP_501_NOT_IMPLEMENTED
-            )
-        except Exception as e:
-            # Handle other errors
-            session.status = 'FAILED'
-            session.save()
-            return Response(
-                {'error': f'Tailoring failed: {str(e)}'},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
-        
-        # Return completed session
-        serializer = self.get_serializer(session)
-        return Response(serializer.data, status=status.HTTP_201_CREATED)
-    
     @action(detail=True, methods=['post'])
     def restart(self, request, pk=None):
         """
         Restart a tailoring session.
-        
+
         POST /api/tailoring/{id}/restart/
-        
-        Creates a new session with the same job and current experience graph.
+
+        Creates a new session with the same job and current experience graph,
+        then queues it for background processing.
         """
         # Get original session
         original_session = self.get_object()
-        
+
+        job = original_session.job
+        if not job.raw_description and not job.source_url:
+            return Response(
+                {'error': 'Job has no description or URL. Add one before tailoring.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
         # Check token quota
         try:
             check_and_increment_tokens(request.user, cost=1)
@@ -210,116 +154,44 @@ class TailoringSessionViewSet(viewsets.ModelViewSet):
                 {'error': str(e)},
                 status=status.HTTP_403_FORBIDDEN
             )
-        
-        # Get current experience graph
+
+        return self._launch_session(
+            request,
+            job=job,
+            parameters=original_session.parameters,
+        )
+
+    def _launch_session(self, request, *, job, parameters):
+        """
+        Shared tail of create/restart: snapshot the experience graph, create
+        the session, queue the background task, and return 202.
+        """
         try:
-            experience_graph = ExperienceGraph.objects.get(user=request.user)
+            # Only the JSON payload is needed for the snapshot
+            experience_graph = ExperienceGraph.objects.only('graph_json').get(user=request.user)
             experience_data = experience_graph.graph_json
         except ExperienceGraph.DoesNotExist:
             return Response(
-                {'error': 'Experience graph not found.'},
+                {'error': 'Experience graph not found. Please create your experience profile first.'},
                 status=status.HTTP_400_BAD_REQUEST
             )
-        
-        # Create new session
-        new_session = TailoringSession.objects.create(
+
+        # Create session; the background task claims it and runs the workflow
+        session = TailoringSession.objects.create(
             user=request.user,
-            job=original_session.job,
+            job=job,
             input_experience_snapshot=experience_data,
-            parameters=original_session.parameters,
-            status='PROCESSING',
+            parameters=parameters,
+            status=TailoringSession.Status.PENDING,
         )
 
-        # Call AgentKit service
-        try:
-            service = AgentKitTailoringService()
-            job = original_session.job
-
-            # Use raw_description if available; OpenAI will fetch from URL via grounding
-            job_description = job.raw_description or ""
-            source_url = job.source_url or ""
-
-            normalized_parameters = service.normalize_parameters(original_session.parameters or {})
-
-            result = service.run_workflow(
-                job_description=job_description,
-                experience_graph=experience_data,
-                parameters=normalized_parameters,
-                source_url=source_url
-            )
-
-            token_usage = result.get("token_usage", {})
-            words_generated = result.get("words_generated", 0)
-            if words_generated:
-                token_usage = {**token_usage, "words_generated": words_generated}
-
-            new_session.generated_title = result.get('title', '')
-            new_session.generated_bullets = result.get('bullets', [])
-            new_session.generated_sections = result.get('sections', [])
-            new_session.tailored_resume = result.get('summary', '')
+        # Hand the OpenAI workflow to Django-Q instead of blocking this
+        # worker for the whole pipeline. With Q_CLUSTER['sync'] = True
+        # (dev default) the task still runs inline; in production the
+        # qcluster picks it up and the response returns immediately.
+        async_task('tailoring.tasks.process_tailoring_session', session.id)
 
-            ats_score = result.get("ats_score", {})
-            suggestions = result.get('suggestions', [])
-            if ats_score:
-                ats_summary = (
-                    f"📊 ATS Compatibility: {ats_score.get('overall_score', 0)}% | "
-                    f"Required Skills: {ats_score.get('required_skills_match', 0)}% | "
-                    f"Keywords: {ats_score.get('keyword_match', 0)}%"
-                )
-                suggestions = [ats_summary] + suggestions
-
-            guardrail_report = result.get('guardrail_report', [])
-            cover_letter_points = result.get("cover_letter_talking_points", [])
-
-            new_session.ai_suggestions = "\n".join(suggestions)
-            new_session.cover_letter = result.get('cover_letter', '')
-            new_session.token_usage = token_usage
-            new_session.openai_run_id = result.get('run_id', '')
-            new_session.parameters = normalized_parameters
-            new_session.output_metadata = {
-                "bullet_details": result.get("bullet_details", []),
-                "guardrails": guardrail_report,
-                "bullet_quality": result.get("bullet_quality", {}),
-                "section_layout": result.get("section_layout", []),
-                "cover_letter_talking_points": cover_letter_points,
-            }
-            new_session.status = TailoringSession.Status.COMPLETED
-            new_session.completed_at = timezone.now()
-            new_session.save(
-                update_fields=[
-                    "generated_title",
-                    "generated_bullets",
-                    "generated_sections",
-                    "tailored_resume",
-                    "ai_suggestions",
-                    "cover_letter",
-                    "token_usage",
-                    "openai_run_id",
-                    "parameters",
-                    "output_metadata",
-                    "status",
-                    "completed_at",
-                    "updated_at",
-                ]
-            )
-
-        except NotImplementedError:
-            new_session.status = 'FAILED'
-            new_session.save()
-            return Response(
-                {
-                    'error': 'AI tailoring service not yet implemented.',
-                    'session_id': new_session.id,
-                },
-                status=status.HTTP_501_NOT_IMPLEMENTED
-            )
-        except Exception as e:
-            new_session.status = 'FAILED'
-            new_session.save()
-            return Response(
-                {'error': f'Tailoring failed: {str(e)}'},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
-        
-        serializer = self.get_serializer(new_session)
-        return Response(serializer.data, status=status.HTTP_201_CREATED)
+        # Reflect whatever the task has done so far (everything, in sync mode)
+        session.refresh_from_db()
+        serializer = self.get_serializer(session)
+        return Response(serializer.data, status=status.HTTP_202_ACCEPTED)